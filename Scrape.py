@@ -14,6 +14,12 @@ Modes:
 
 Dependencies:
  - pip install requests beautifulsoup4 selenium python-dateutil
+ - Optional HTML parsers, used in this order when installed:
+   lxml (one parse for both text and per-row serial lookup), selectolax (fast text only),
+   else BeautifulSoup with the stdlib html.parser
+ - Optional: pip install pyahocorasick (single-pass search for many CNRs with --cases-file)
+ - Optional: pip install orjson (faster JSON output)
+ - Optional: pip install google-re2 (linear-time case TYPE/NUMBER/YEAR search)
  - Chrome/Chromium and matching chromedriver must be installed for Selenium mode.
    (or use webdriver-manager to auto-download chromedriver)
  - Set ECOURTS_API_KEY environment variable if you have API access.
@@ -25,6 +31,9 @@ Usage examples:
   # API mode (if you have API key and endpoint configured in code)
   ECOURTS_API_KEY=your_key python ecourts_causelist_checker.py --tomorrow --case "CC" 123 2023 --out result.json
 
+  # Batch mode: several cases in one run, one cause-list fetch per (date, court complex, court)
+  python ecourts_causelist_checker.py --api --cases-file cases.json --out results.json
+
 """
 
 import os
@@ -32,11 +41,46 @@ import re
 import json
 import argparse
 import datetime
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dateutil import tz, relativedelta
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+# HTML text extraction, in order of preference: lxml, selectolax, BeautifulSoup (html.parser)
+try:
+    from lxml import html as lxml_html
+    from lxml.etree import LxmlError
+except ImportError:
+    lxml_html = None
+
+# selectolax (lexbor) is far faster than BeautifulSoup for plain text extraction
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# google-re2 gives linear-time (DFA) matching for the case-parts search; re is the fallback
+try:
+    import re2 as re_impl
+except ImportError:
+    re_impl = re
+
+# Aho-Corasick automaton for finding many CNRs in one pass over the text
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# orjson (C extension) serializes large outputs much faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # network libs
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # selenium imports (interactive fallback)
 from selenium import webdriver
@@ -46,11 +90,43 @@ from selenium.webdriver.common.action_chains import ActionChains
 import time
 import base64
 
+# CSS selector for the rendered cause-list container (read straight from the browser)
+CAUSE_LIST_CSS = "table.cause_list, #causelist, .causelist-table"
+
+# only parse the parts of the page that can hold the cause list: tables, and divs whose id
+# looks like a cause-list/result container
+_CAUSE_LIST_ID_RE = re.compile(r"cause|list|result", re.I)
+
+def _is_cause_list_container(name, attrs):
+    if name == "table":
+        return True
+    return name == "div" and bool(_CAUSE_LIST_ID_RE.search((attrs or {}).get("id") or ""))
+
+class _CauseListStrainer(SoupStrainer):
+    """
+    Keeps tables and cause-list divs. bs4 < 4.13 calls the name function with
+    (name, attrs) while parsing; 4.13+ asks allow_tag_creation instead, whose default
+    would pass the function only the tag name.
+    """
+    def allow_tag_creation(self, nsprefix, name, attrs):
+        return _is_cause_list_container(name, attrs)
+
+CAUSE_LIST_STRAINER = _CauseListStrainer(_is_cause_list_container)
+
+# patterns used when guessing serial number / court name from a match context
+_SERIAL_RE = re.compile(r'\bSerial\b[:\s]*([0-9]+)', re.IGNORECASE)
+_COURT_RE = re.compile(r'Court\s*[:\-]\s*([A-Za-z0-9 ,.-]+)')
+_SERIAL_CELL_RE = re.compile(r'^\s*(\d+)\.?\s*$')
+
+# resolved once; tz.gettz hits the zoneinfo files on every call
+_TZ_IND = tz.gettz('Asia/Kolkata')
+
 # ---------- Helper functions ----------
 
-def iso_date_for(which='today'):
-    tz_ind = tz.gettz('Asia/Kolkata')
-    now = datetime.datetime.now(tz=tz_ind).date()
+def iso_date_for(which='today', now=None):
+    """Resolve 'today'/'tomorrow' (IST) to YYYY-MM-DD; pass `now` (a date) to reuse one clock read."""
+    if now is None:
+        now = datetime.datetime.now(tz=_TZ_IND).date()
     if which == 'today':
         return now.strftime('%Y-%m-%d')
     elif which == 'tomorrow':
@@ -58,14 +134,86 @@ def iso_date_for(which='today'):
     else:
         return which
 
+def parse_cause_list_html(page_html):
+    """
+    Parse only the cause-list container(s) of the page using one SoupStrainer.
+    Falls back to a single full parse if it matches nothing.
+    """
+    soup = BeautifulSoup(page_html, 'html.parser', parse_only=CAUSE_LIST_STRAINER)
+    if soup.get_text(strip=True):
+        return soup
+    return BeautifulSoup(page_html, 'html.parser')
+
+def _lxml_tree(html):
+    """lxml element for html, or None if lxml is missing or cannot parse it."""
+    if lxml_html is None:
+        return None
+    try:
+        return lxml_html.fromstring(html)
+    except (ValueError, LxmlError):
+        # e.g. a str with an XML encoding declaration, or an empty document
+        return None
+
+def parse_cause_list(page_html):
+    """
+    Parse the page once and return (text, tree). With lxml installed the tree is an lxml
+    element that can also be queried with xpath (see serial_from_tree); otherwise, or if lxml
+    cannot parse the page, tree is None and the text comes from selectolax or BeautifulSoup.
+    """
+    tree = _lxml_tree(page_html)
+    if tree is not None:
+        return "\n".join(tree.xpath('//text()[not(ancestor::script or ancestor::style)]')), tree
+    return extract_cause_list_text(page_html), None
+
+def cause_list_tree(fetch_result):
+    """lxml tree for a CauseListBrowser.fetch result, parsed from raw_html on first use."""
+    if 'tree' not in fetch_result:
+        fetch_result['tree'] = _lxml_tree(fetch_result.get('raw_html') or '')
+    return fetch_result['tree']
+
+def extract_cause_list_text(page_html):
+    """Return the visible text of the page, using selectolax if installed, else BeautifulSoup."""
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(page_html)
+        # drop inline JS/CSS, as the lxml and BeautifulSoup paths do
+        tree.strip_tags(['script', 'style'])
+        return tree.body.text(separator="\n") if tree.body else tree.text(separator="\n")
+    soup = parse_cause_list_html(page_html)
+    return soup.get_text(separator="\n")
+
 def save_json(obj, path):
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(obj, f, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f, ensure_ascii=False, indent=2)
     print(f"[+] Saved JSON to {path}")
 
 # ---------- API mode (sketch / placeholder) ----------
 # NOTE: official eCourts API requires auth. If you have a key, set env var ECOURTS_API_KEY.
 # The real endpoint and parameters should be obtained from the eCourts API docs / your admin.
+
+# shared session so repeated API calls reuse pooled keep-alive connections;
+# concurrent API calls are capped at the pool size
+API_MAX_WORKERS = 8
+# set once the batch endpoint turns out not to exist, so it is not probed again
+_BATCH_ENDPOINT_MISSING = False
+
+def _batch_route_missing(status_code):
+    """
+    True if a batch-route status means the server has no such route (404/405/501, or
+    another client error); auth and rate-limit errors apply to every route, so they don't count.
+    """
+    return status_code == 501 or (400 <= status_code < 500 and status_code not in (401, 403, 429))
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=API_MAX_WORKERS,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504],
+                      allowed_methods=frozenset(['GET', 'POST']))
+))
+
 def api_get_cause_list_by_params(api_key, state_code, district_code, complex_code, court_code, date_iso, jurisdiction='district'):
     """
     Placeholder function showing how to call a cause-list API if you have API access.
@@ -84,83 +232,265 @@ def api_get_cause_list_by_params(api_key, state_code, district_code, complex_cod
         "court_code": court_code,
         "cause_list_date": date_iso
     }
-    resp = requests.post(endpoint, headers=headers, json=payload, timeout=30)
+    resp = _SESSION.post(endpoint, headers=headers, json=payload, timeout=30)
     resp.raise_for_status()
     return resp.json()
 
+def api_get_cause_lists_batch(api_key, queries, date_iso, max_batch=50):
+    """
+    Placeholder batch variant: fetch the cause lists for several courts on one date.
+    `queries` is a list of dicts with state_code, district_code, court_complex and court_code.
+    Returns one response per query, in order, sending max_batch queries per request.
+    Returns None if the server has no batch endpoint (see _batch_route_missing); that is
+    remembered for the rest of the run so callers go straight to one
+    api_get_cause_list_by_params per court.
+    """
+    global _BATCH_ENDPOINT_MISSING
+    if _BATCH_ENDPOINT_MISSING:
+        return None
+    # Example placeholder endpoint (replace with your API endpoint from eCourts docs)
+    endpoint = "https://apis.ecourts.gov.in/eciapi/17/district-court/cause-list/batch"
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Accept": "application/json",
+    }
+    results = []
+    for i in range(0, len(queries), max_batch):
+        chunk = queries[i:i+max_batch]
+        resp = _SESSION.post(endpoint, headers=headers,
+                             json={"queries": chunk, "cause_list_date": date_iso}, timeout=30)
+        if _batch_route_missing(resp.status_code):
+            _BATCH_ENDPOINT_MISSING = True
+            return None
+        resp.raise_for_status()
+        chunk_results = resp.json().get('results', [])
+        if len(chunk_results) != len(chunk):
+            raise ValueError(f"batch endpoint returned {len(chunk_results)} results for {len(chunk)} queries")
+        results.extend(chunk_results)
+    return results
+
+def api_fetch_cause_lists(api_key, keys_by_date):
+    """
+    Fetch the cause lists for {date_iso: [(date_iso, court_complex, court), ...]}.
+    Yields (keys, responses, error) as each batch or single-court call completes. All calls
+    run in one thread pool of at most API_MAX_WORKERS on the shared session. The batch
+    endpoint is probed once, before the pool starts; if it is missing every court is
+    fetched with its own call.
+    """
+    # !!! You must replace the parameters below with the official ones from your API docs !!!
+    def fetch_court(key):
+        date_iso, complex_name, court = key
+        return [api_get_cause_list_by_params(api_key, state_code='09', district_code='13',
+                                             complex_code=complex_name or '', court_code=court or '',
+                                             date_iso=date_iso)]
+
+    def batch_queries(keys):
+        return [{"state_code": '09', "district_code": '13',
+                 "court_complex": complex_name or '', "court_code": court or ''}
+                for _, complex_name, court in keys]
+
+    def fetch_batch(date_iso, keys):
+        responses = api_get_cause_lists_batch(api_key, batch_queries(keys), date_iso)
+        if responses is None:
+            # batch endpoint went away after the probe; stay inside this worker
+            responses = [fetch_court(key)[0] for key in keys]
+        return responses
+
+    pending = dict(keys_by_date)
+    # probe the batch endpoint with the first multi-court date, so a missing route is only hit once
+    probe_date = next((d for d, keys in pending.items() if len(keys) > 1), None)
+    if probe_date is not None and not _BATCH_ENDPOINT_MISSING:
+        keys = pending.pop(probe_date)
+        try:
+            responses = api_get_cause_lists_batch(api_key, batch_queries(keys), probe_date)
+        except Exception as e:
+            yield keys, None, e
+        else:
+            if responses is None:
+                pending[probe_date] = keys
+            else:
+                yield keys, responses, None
+
+    units = []
+    for date_iso, keys in pending.items():
+        if len(keys) > 1 and not _BATCH_ENDPOINT_MISSING:
+            units.append((keys, fetch_batch, (date_iso, keys)))
+        else:
+            units.extend(([key], fetch_court, (key,)) for key in keys)
+    if not units:
+        return
+    if len(units) == 1:
+        keys, fn, fn_args = units[0]
+        try:
+            yield keys, fn(*fn_args), None
+        except Exception as e:
+            yield keys, None, e
+        return
+    with ThreadPoolExecutor(max_workers=min(len(units), API_MAX_WORKERS)) as pool:
+        futures = {pool.submit(fn, *fn_args): keys for keys, fn, fn_args in units}
+        for future in as_completed(futures):
+            try:
+                yield futures[future], future.result(), None
+            except Exception as e:
+                yield futures[future], None, e
+
 # ---------- Selenium interactive fallback ----------
-def selenium_fetch_cause_list_interactive(
-        target_date_iso='today',
-        court_complex=None,
-        court_name=None,
-        civ_or_crim='Civil',
-        download_pdf=False,
-        headless=False
-    ):
+class CauseListBrowser:
     """
-    This function:
+    One Chrome session reused for several cause-list lookups (Chrome startup takes seconds).
+
+        with CauseListBrowser(headless=False) as browser:
+            res = browser.fetch(date_iso, court_complex, court_name)
+
+    For each fetch:
      - opens the district cause list page (eCourts / local district page)
      - you manually solve the CAPTCHA presented (script pauses and prompts)
      - after you press Enter, it clicks the Civil/Criminal button and waits for result
      - it tries to extract the displayed cause list HTML/text
-     - optionally, save PDF via Page.printToPDF (Chrome DevTools)
-    Returns a dict with extracted text and optionally base64 pdf bytes (if available)
+     - optionally, save PDF via Page.printToPDF (Chrome DevTools) to pdf_out_path
+       (default cause_list_<date>.pdf)
     """
     # Choose the site (example: newdelhi.dcourts)
     target_url = "https://newdelhi.dcourts.gov.in/cause-list-%E2%81%84-daily-board/"  # user-specified site
-    chrome_opts = Options()
-    if headless:
-        chrome_opts.add_argument("--headless=new")  # modern headless
-    chrome_opts.add_argument("--disable-gpu")
-    chrome_opts.add_argument("--no-sandbox")
-    chrome_opts.add_argument("--window-size=1200,900")
-
-    driver = webdriver.Chrome(options=chrome_opts)
-    driver.get(target_url)
-    print("[i] Browser opened. You must now interactively select options on the page and solve the CAPTCHA.")
-    print("    - Select Court Complex / Court Establishment / Court Number and Date")
-    print("    - Enter the CAPTCHA on the page and click the 'Civil' or 'Criminal' button to display cause list")
-    input("After you've solved the CAPTCHA and the cause list for your court/date is visible in the browser, press Enter here to continue...")
-
-    # Wait a little for the page to fully render the cause list (adjust as needed)
-    time.sleep(2)
-
-    # Attempt to find a PDF viewer or cause list container
-    page_html = driver.page_source
-    soup = BeautifulSoup(page_html, 'html.parser')
-
-    # Try to find text-based cause list (the site sometimes prints HTML)
-    text_content = soup.get_text(separator="\n")
-    result = {
-        "raw_html": str(soup),
-        "raw_text": text_content
-    }
 
-    # Optionally attempt to save PDF using Chrome CDP printToPDF
-    pdf_b64 = None
-    if download_pdf:
-        try:
-            # Use CDP to print page as PDF
-            print("[i] Attempting to print page to PDF via Chrome DevTools protocol...")
-            # selenium 4 has execute_cdp_cmd
-            print_options = {
-                "landscape": False,
-                "displayHeaderFooter": False,
-                "printBackground": True,
-                "preferCSSPageSize": True
+    def __init__(self, headless=False):
+        self.headless = headless
+        self.driver = None
+
+    def __enter__(self):
+        chrome_opts = Options()
+        if self.headless:
+            chrome_opts.add_argument("--headless=new")  # modern headless
+        chrome_opts.add_argument("--disable-gpu")
+        chrome_opts.add_argument("--no-sandbox")
+        chrome_opts.add_argument("--window-size=1200,900")
+        self.driver = webdriver.Chrome(options=chrome_opts)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.driver is not None:
+            self.driver.quit()
+            self.driver = None
+        return False
+
+    def read_containers(self):
+        """Joined text and outerHTML of the outermost cause-list containers on the current page."""
+        containers = self.driver.find_elements(By.CSS_SELECTOR, CAUSE_LIST_CSS)
+        if len(containers) > 1:
+            # drop matches nested in another match (e.g. tables inside #causelist)
+            containers = self.driver.execute_script(
+                "return arguments[0].filter(el => !arguments[0].some(o => o !== el && o.contains(el)));",
+                containers)
+        texts = [el.text for el in containers]
+        if not any(texts):
+            return '', None
+        return "\n".join(texts), "\n".join(el.get_attribute("outerHTML") for el in containers)
+
+    def read_page(self):
+        """The whole current page, parsed once (see parse_cause_list)."""
+        page_html = self.driver.page_source
+        text_content, tree = parse_cause_list(page_html)
+        return {
+            "raw_html": page_html,
+            "raw_text": text_content,
+            "tree": tree
+        }
+
+    def fetch(self, target_date_iso='today', court_complex=None, court_name=None,
+              civ_or_crim='Civil', download_pdf=False, pdf_out_path=None):
+        """Returns a dict with extracted text and optionally the saved PDF path (if available)."""
+        driver = self.driver
+        driver.get(self.target_url)
+        print("[i] Browser opened. You must now interactively select options on the page and solve the CAPTCHA.")
+        print(f"    - Select Court Complex / Court Establishment / Court Number and Date "
+              f"({court_complex or 'any complex'} / {court_name or 'any court'} / {target_date_iso})")
+        print("    - Enter the CAPTCHA on the page and click the 'Civil' or 'Criminal' button to display cause list")
+        input("After you've solved the CAPTCHA and the cause list for your court/date is visible in the browser, press Enter here to continue...")
+
+        # Wait a little for the page to fully render the cause list (adjust as needed)
+        time.sleep(2)
+
+        # Attempt to find the cause list containers; the browser already has the DOM, so just ask it for the text
+        text_content, container_html = self.read_containers()
+        if text_content:
+            # "partial": only the containers were read, see read_page for the whole page.
+            # The lxml tree is only built if a CNR match needs it (see cause_list_tree)
+            result = {
+                "raw_html": container_html,
+                "raw_text": text_content,
+                "partial": True
             }
-            pdf_b64 = driver.execute_cdp_cmd("Page.printToPDF", print_options).get("data")
-            if pdf_b64:
-                result["cause_list_pdf_b64"] = pdf_b64
-            else:
-                print("[!] PDF generation returned no data.")
-        except Exception as e:
-            print("[!] PDF generation failed:", e)
+        else:
+            # Try to find text-based cause list in the full page (the site sometimes prints HTML)
+            result = self.read_page()
+
+        # Optionally attempt to save PDF using Chrome CDP printToPDF
+        if download_pdf:
+            try:
+                # Use CDP to print page as PDF
+                print("[i] Attempting to print page to PDF via Chrome DevTools protocol...")
+                # selenium 4 has execute_cdp_cmd
+                print_options = {
+                    "landscape": False,
+                    "displayHeaderFooter": False,
+                    "printBackground": True,
+                    "preferCSSPageSize": True
+                }
+                pdf_b64 = driver.execute_cdp_cmd("Page.printToPDF", print_options).get("data")
+                if pdf_b64:
+                    pdf_out_path = pdf_out_path or f"cause_list_{target_date_iso}.pdf"
+                    with open(pdf_out_path, 'wb') as pf:
+                        pf.write(base64.b64decode(pdf_b64))
+                    del pdf_b64
+                    print(f"[+] Saved cause list PDF to {pdf_out_path}")
+                    result["cause_list_pdf"] = pdf_out_path
+                else:
+                    print("[!] PDF generation returned no data.")
+            except Exception as e:
+                print("[!] PDF generation failed:", e)
 
-    driver.quit()
-    return result
+        return result
+
+def selenium_fetch_cause_list_interactive(
+        target_date_iso='today',
+        court_complex=None,
+        court_name=None,
+        civ_or_crim='Civil',
+        download_pdf=False,
+        headless=False,
+        pdf_out_path=None
+    ):
+    """
+    Single lookup in a fresh browser; see CauseListBrowser.fetch.
+    Returns a dict with extracted text and optionally the saved PDF path (if available)
+    """
+    with CauseListBrowser(headless=headless) as browser:
+        return browser.fetch(target_date_iso, court_complex, court_name, civ_or_crim, download_pdf, pdf_out_path)
 
 # ---------- Search helpers ----------
+def _line_context(text, idx, before=3, after=3):
+    """
+    Return (context, line_no) for the line containing offset idx, plus `before`/`after`
+    surrounding lines, by walking newlines from idx instead of splitting the whole text.
+    """
+    line_no = text.count('\n', 0, idx)
+    start = idx
+    for _ in range(before + 1):
+        start = text.rfind('\n', 0, start)
+        if start == -1:
+            break
+    start += 1
+    stop = idx - 1
+    for _ in range(after + 1):
+        nxt = text.find('\n', stop + 1)
+        if nxt == -1:
+            # a trailing newline ends the text; there is no empty line after it
+            if stop + 1 < len(text):
+                stop = len(text)
+            break
+        stop = nxt
+    return text[start:stop], line_no
+
 def search_case_in_text_by_cnr(text, cnr):
     """
     Searches the cause-list text for the CNR string. Returns first match lines and a context block.
@@ -170,43 +500,182 @@ def search_case_in_text_by_cnr(text, cnr):
     idx = text.find(cnr)
     if idx == -1:
         return None
-    # find line and a few lines of context
-    lines = text.splitlines()
-    for i,ln in enumerate(lines):
-        if cnr in ln:
-            # try to guess serial/court info from surrounding lines
-            context = "\n".join(lines[max(0,i-3):i+4])
-            # naive serial extraction: search for nearby 'Serial' or digits
-            m_serial = re.search(r'\bSerial\b[:\s]*([0-9]+)', context, re.IGNORECASE)
-            serial = m_serial.group(1) if m_serial else None
-            # naive court name: look for common court headings in context
-            m_court = re.search(r'Court\s*[:\-]\s*([A-Za-z0-9 ,.-]+)', context)
-            court = m_court.group(1).strip() if m_court else None
-            return {"context": context, "line_no": i, "serial": serial, "court": court}
-    return None
+    return _cnr_match(text, idx)
+
+def _cnr_match(text, idx):
+    """Build the match dict (context, line number, guessed serial/court) for a CNR hit at idx."""
+    context, line_no = _line_context(text, idx)
+    # naive serial extraction: search for nearby 'Serial' or digits
+    m_serial = _SERIAL_RE.search(context)
+    serial = m_serial.group(1) if m_serial else None
+    # naive court name: look for common court headings in context
+    m_court = _COURT_RE.search(context)
+    court = m_court.group(1).strip() if m_court else None
+    return {"context": context, "line_no": line_no, "serial": serial, "court": court}
+
+def serial_from_tree(tree, cnr):
+    """
+    Serial number from the first cell of the table row holding the CNR, or None if
+    that cell is not a plain number (e.g. "12" or "12.") or is the CNR cell itself.
+    """
+    # innermost row only: with nested layout tables the outer row's td[1] holds the inner table
+    cells = tree.xpath('(//tr[td[contains(., $cnr)]][not(.//tr[td[contains(., $cnr)]])])[1]/td[1]', cnr=cnr)
+    if not cells:
+        return None
+    cell_text = cells[0].text_content()
+    if cnr in cell_text:
+        return None
+    m = _SERIAL_CELL_RE.match(cell_text)
+    return m.group(1) if m else None
+
+def search_cnrs_in_text(text, cnrs):
+    """
+    Search the text for several CNRs at once. Returns {cnr: match} for the first hit of each.
+    Uses a single Aho-Corasick pass when pyahocorasick is installed, else one find() per CNR.
+    """
+    cnrs = {c for c in cnrs if c}
+    if ahocorasick is None or len(cnrs) < 2:
+        found = {}
+        for cnr in cnrs:
+            match = search_case_in_text_by_cnr(text, cnr)
+            if match:
+                found[cnr] = match
+        return found
+    automaton = ahocorasick.Automaton()
+    for cnr in cnrs:
+        automaton.add_word(cnr, cnr)
+    automaton.make_automaton()
+    found = {}
+    for end, cnr in automaton.iter(text):
+        if cnr not in found:
+            found[cnr] = _cnr_match(text, end - len(cnr) + 1)
+            if len(found) == len(cnrs):
+                break
+    return found
+
+@functools.lru_cache(maxsize=128)
+def _case_part_pattern(case_type, number, year):
+    """Single compiled alternation for a case-type/number/year combination (cached per case)."""
+    # build common patterns: "CC NI ACT/10611/2022" or "CC NI ACT/10611/2" etc.
+    patterns = [
+        rf'\b{re.escape(case_type)}\b.*?{re.escape(number)}.*?{re.escape(year)}',
+        rf'{re.escape(case_type)}[^\n]*{re.escape(number)}[^\n]*{re.escape(year)}',
+        rf'\b{re.escape(number)}/{re.escape(year)}\b'
+    ]
+    # inline flags so the same pattern works with both re and re2
+    return re_impl.compile("(?is:" + "|".join(patterns) + ")")
 
 def search_case_by_parts(text, case_type, number, year):
     """Find occurrences of a case-type/number/year combination in text."""
     if not (case_type and number and year):
         return None
-    # build common patterns: "CC NI ACT/10611/2022" or "CC NI ACT/10611/2" etc.
-    patterns = [
-        rf'\b{re.escape(case_type)}\b.*?{re.escape(str(number))}.*?{re.escape(str(year))}',
-        rf'{re.escape(case_type)}[^\n]*{re.escape(str(number))}[^\n]*{re.escape(str(year))}',
-        rf'\b{re.escape(str(number))}/{re.escape(str(year))}\b'
-    ]
-    for p in patterns:
-        m = re.search(p, text, flags=re.IGNORECASE | re.DOTALL)
-        if m:
-            start = max(0, m.start()-200)
-            stop = m.end()+200
-            ctx = text[start:stop]
-            # try to extract serial similarly
-            m_serial = re.search(r'\bSerial\b[:\s]*([0-9]+)', ctx, re.IGNORECASE)
-            serial = m_serial.group(1) if m_serial else None
-            return {"context": ctx, "serial": serial}
+    number, year = str(number), str(year)
+    # every pattern needs the literal number and year; skip the regex when either is absent
+    if number not in text or year not in text:
+        return None
+    m = _case_part_pattern(case_type, number, year).search(text)
+    if m:
+        start = max(0, m.start()-200)
+        stop = m.end()+200
+        ctx = text[start:stop]
+        # try to extract serial similarly
+        m_serial = _SERIAL_RE.search(ctx)
+        serial = m_serial.group(1) if m_serial else None
+        return {"context": ctx, "serial": serial}
+    return None
+
+def _walk_match(obj, needle):
+    """Return the innermost dict in a decoded JSON object with a string field containing needle."""
+    if isinstance(obj, dict):
+        for value in obj.values():
+            if isinstance(value, (dict, list)):
+                found = _walk_match(value, needle)
+                if found is not None:
+                    return found
+        if any(isinstance(value, str) and needle in value for value in obj.values()):
+            return obj
+    elif isinstance(obj, list):
+        for item in obj:
+            found = _walk_match(item, needle)
+            if found is not None:
+                return found
     return None
 
+def _walk_records(obj):
+    """Yield every dict in a decoded JSON object."""
+    if isinstance(obj, dict):
+        yield obj
+        for value in obj.values():
+            yield from _walk_records(value)
+    elif isinstance(obj, list):
+        for item in obj:
+            yield from _walk_records(item)
+
+def search_api_response(api_res, query):
+    """
+    Find the cause-list record for a query in a decoded API response, without
+    re-serializing it: CNR by substring in any string field, case parts by exact
+    case_type/case_number/case_year fields. The match has the record itself under
+    "record" and a compact JSON dump of it as "context".
+    """
+    if 'cnr' in query:
+        record = _walk_match(api_res, query['cnr']) if query['cnr'] else None
+    else:
+        case_type, number, year = query.get('case_type'), query.get('case_number'), query.get('case_year')
+        record = next((
+            rec for rec in _walk_records(api_res)
+            if str(rec.get('case_type', '')).strip().upper() == case_type.upper()
+            and str(rec.get('case_number', '')).strip() == number
+            and str(rec.get('case_year', '')).strip() == year
+        ), None)
+    if record is None:
+        return None
+    # context stays a string like the text matches; the structured record goes under its own key
+    return {"context": json.dumps(record, ensure_ascii=False, separators=(',', ':')), "record": record,
+            "serial": record.get('serial'), "court": record.get('court')}
+
+def search_queries(text, queries):
+    """Run the CNR or case-type/number/year search for each query dict; returns matches in order."""
+    cnr_hits = search_cnrs_in_text(text, [q['cnr'] for q in queries if 'cnr' in q])
+    return [
+        cnr_hits.get(q['cnr']) if 'cnr' in q
+        else search_case_by_parts(text, q.get('case_type'), q.get('case_number'), q.get('case_year'))
+        for q in queries
+    ]
+
+def load_cases_file(path):
+    """
+    Load a JSON list of cases to check. Each entry has either "cnr" or "case_type",
+    "case_number" and "case_year", and may set its own "date" ('today', 'tomorrow' or
+    YYYY-MM-DD), "court_complex" and "court". Raises ValueError naming the first bad entry.
+    """
+    with open(path, encoding='utf-8') as f:
+        entries = json.load(f)
+    if not isinstance(entries, list):
+        raise ValueError(f"{path}: expected a JSON list of cases")
+    cases = []
+    for n, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            raise ValueError(f"{path}: entry {n} is not an object: {entry!r}")
+        if entry.get('cnr'):
+            query = {'cnr': str(entry['cnr']).strip()}
+        else:
+            if not all(entry.get(k) for k in ('case_type', 'case_number', 'case_year')):
+                raise ValueError(f"{path}: entry {n} needs \"cnr\" or \"case_type\", \"case_number\" "
+                                 f"and \"case_year\": {entry!r}")
+            query = {
+                'case_type': str(entry['case_type']).strip(),
+                'case_number': str(entry['case_number']).strip(),
+                'case_year': str(entry['case_year']).strip(),
+            }
+        cases.append({
+            "query": query,
+            "date": entry.get('date'),
+            "court_complex": entry.get('court_complex'),
+            "court": entry.get('court'),
+        })
+    return cases
+
 # ---------- CLI / main ----------
 def main():
     parser = argparse.ArgumentParser(description="Check eCourts cause-list for a case (today/tomorrow).")
@@ -214,6 +683,7 @@ def main():
     g.add_argument('--cnr', help='Full CNR string (16 chars)')
     g_case = g.add_argument_group('case')
     g.add_argument('--case', nargs=3, metavar=('TYPE','NUMBER','YEAR'), help='Case specified as TYPE NUMBER YEAR, e.g. "CC" 123 2022')
+    g.add_argument('--cases-file', help='JSON list of cases to check in one run (see load_cases_file)')
     parser.add_argument('--today', action='store_true', help='Check for today (default)')
     parser.add_argument('--tomorrow', action='store_true', help='Check for tomorrow')
     parser.add_argument('--court-complex', default=None, help='Court Complex name (for Selenium interactive mode)')
@@ -221,6 +691,7 @@ def main():
     parser.add_argument('--causelist', action='store_true', help='Download entire cause list PDF (interactive mode)')
     parser.add_argument('--api', action='store_true', help='Try API mode (requires ECOURTS_API_KEY env var and valid API endpoint)')
     parser.add_argument('--out', default='ecourts_result.json', help='Output JSON filename')
+    parser.add_argument('--verbose-output', action='store_true', help='Include raw API response / page HTML and text in the output JSON (large)')
     parser.add_argument('--headless', action='store_true', help='Run Chrome headless in Selenium mode (may be blocked by captcha)')
     args = parser.parse_args()
 
@@ -231,96 +702,128 @@ def main():
     elif args.today:
         date_choice = 'today'
 
-    date_iso = iso_date_for(date_choice)
-
-    # build query
-    query = {}
-    if args.cnr:
-        query['cnr'] = args.cnr.strip()
-    elif args.case:
-        typ, num, yr = args.case
-        query['case_type'] = typ.strip()
-        query['case_number'] = num.strip()
-        query['case_year'] = yr.strip()
-
-    output = {
-        "query": query,
-        "checked_date": date_iso,
-        "method": None,
-        "found": False,
-        "matches": [],
-        "notes": []
-    }
+    # build queries
+    if args.cases_file:
+        try:
+            cases = load_cases_file(args.cases_file)
+        except (OSError, ValueError) as e:
+            parser.error(f"--cases-file: {e}")
+    else:
+        query = {}
+        if args.cnr:
+            query['cnr'] = args.cnr.strip()
+        elif args.case:
+            typ, num, yr = args.case
+            query['case_type'] = typ.strip()
+            query['case_number'] = num.strip()
+            query['case_year'] = yr.strip()
+        cases = [{"query": query, "date": None, "court_complex": None, "court": None}]
+
+    # one output per case; cases sharing (date, court complex, court) share one cause list
+    outputs = []
+    groups = {}
+    today = datetime.datetime.now(tz=_TZ_IND).date()
+    for case in cases:
+        date_iso = iso_date_for(case['date'] or date_choice, now=today)
+        key = (date_iso, case['court_complex'] or args.court_complex, case['court'] or args.court)
+        groups.setdefault(key, []).append(len(outputs))
+        outputs.append({
+            "query": case['query'],
+            "checked_date": date_iso,
+            "method": None,
+            "found": False,
+            "matches": [],
+            "notes": []
+        })
 
     # Try API mode if requested and API key is present
     if args.api:
         api_key = os.getenv('ECOURTS_API_KEY')
         if not api_key:
             print("[!] ECOURTS_API_KEY not set in environment; skipping API mode.")
-            output['notes'].append("API mode requested but ECOURTS_API_KEY not set.")
+            for output in outputs:
+                output['notes'].append("API mode requested but ECOURTS_API_KEY not set.")
         else:
-            output['method'] = 'api'
-            try:
-                # !!! You must replace the parameters below with the official ones from your API docs !!!
-                print("[i] Calling eCourts API (placeholder). Replace endpoint/params with official ones.")
-                api_res = api_get_cause_list_by_params(api_key, state_code='09', district_code='13',
-                                                      complex_code=args.court_complex or '', court_code=args.court or '',
-                                                      date_iso=date_iso)
-                # Example: api_res should contain cause list items you can search
-                text_blob = json.dumps(api_res)  # convert to text for search
-                if 'cnr' in query:
-                    match = search_case_in_text_by_cnr(text_blob, query['cnr'])
-                else:
-                    match = search_case_by_parts(text_blob, query['case_type'], query['case_number'], query['case_year'])
-                if match:
-                    output['found'] = True
-                    output['matches'].append(match)
-                else:
-                    output['found'] = False
-                output['api_response_sample'] = api_res
-            except Exception as e:
-                output['notes'].append(f"API error: {e}")
-                print("[!] API mode failed:", e)
-
-    # If not found / not using API, fallback to interactive Selenium
-    if not output.get('found'):
-        output['method'] = output.get('method') or 'selenium_interactive'
+            print("[i] Calling eCourts API (placeholder). Replace endpoint/params with official ones.")
+            keys_by_date = {}
+            for key in groups:
+                keys_by_date.setdefault(key[0], []).append(key)
+            for keys, responses, e in api_fetch_cause_lists(api_key, keys_by_date):
+                if e is not None:
+                    print("[!] API mode failed:", e)
+                    for key in keys:
+                        for i in groups[key]:
+                            outputs[i]['method'] = 'api'
+                            outputs[i]['notes'].append(f"API error: {e}")
+                    continue
+                for key, api_res in zip(keys, responses):
+                    # Example: api_res should contain cause list items you can search
+                    for i in groups[key]:
+                        output = outputs[i]
+                        output['method'] = 'api'
+                        match = search_api_response(api_res, output['query'])
+                        if match:
+                            output['found'] = True
+                            output['matches'].append(match)
+                        if args.verbose_output:
+                            output['api_response_sample'] = api_res
+
+    # If not found / not using API, fallback to interactive Selenium (one browser, one lookup per cause list)
+    pending_groups = []
+    for n, (key, indices) in enumerate(groups.items()):
+        pending = [outputs[i] for i in indices if not outputs[i].get('found')]
+        if pending:
+            pending_groups.append((n, key, pending))
+    if pending_groups:
         print("[i] Falling back to Selenium interactive mode. A Chrome window will open.")
-        sres = selenium_fetch_cause_list_interactive(
-            target_date_iso=date_iso,
-            court_complex=args.court_complex,
-            court_name=args.court,
-            civ_or_crim='Civil',
-            download_pdf=args.causelist,
-            headless=args.headless
-        )
-        text_blob = sres.get('raw_text','')
-        if 'cnr' in query:
-            match = search_case_in_text_by_cnr(text_blob, query['cnr'])
-        else:
-            match = search_case_by_parts(text_blob, query.get('case_type'), query.get('case_number'), query.get('case_year'))
-
-        if match:
-            output['found'] = True
-            output['matches'].append(match)
-            print("[+] Case found. Context:")
-            print(match['context'])
-            if match.get('serial'): print("Serial:", match.get('serial'))
-            if match.get('court'): print("Court:", match.get('court'))
-        else:
-            print("[!] Case not found in the displayed cause list content.")
-            output['notes'].append("Case not found in the displayed cause list content.")
-        # if pdf was captured, save it
-        if sres.get('cause_list_pdf_b64'):
-            pdf_bytes = base64.b64decode(sres['cause_list_pdf_b64'])
-            pdf_path = f"cause_list_{date_iso}.pdf"
-            with open(pdf_path, 'wb') as pf:
-                pf.write(pdf_bytes)
-            print(f"[+] Saved cause list PDF to {pdf_path}")
-            output['cause_list_pdf'] = pdf_path
+        with CauseListBrowser(headless=args.headless) as browser:
+            for n, (date_iso, court_complex, court), pending in pending_groups:
+                sres = browser.fetch(
+                    target_date_iso=date_iso,
+                    court_complex=court_complex,
+                    court_name=court,
+                    civ_or_crim='Civil',
+                    download_pdf=args.causelist,
+                    pdf_out_path=f"cause_list_{date_iso}.pdf" if len(groups) == 1 else f"cause_list_{date_iso}_{n}.pdf"
+                )
+                queries = [o['query'] for o in pending]
+                matches = search_queries(sres.get('raw_text',''), queries)
+                sources = [sres] * len(pending)
+                page = sres
+                missed = [i for i, match in enumerate(matches) if match is None]
+                if missed and sres.get('partial'):
+                    # the containers may not hold every listing; search the whole page for the misses
+                    page = browser.read_page()
+                    for i, match in zip(missed, search_queries(page['raw_text'], [queries[i] for i in missed])):
+                        matches[i], sources[i] = match, page
+                for output, match, source in zip(pending, matches, sources):
+                    output['method'] = output.get('method') or 'selenium_interactive'
+                    if match and 'cnr' in output['query']:
+                        tree = cause_list_tree(source)
+                        if tree is not None:
+                            # exact serial from the table row instead of the text heuristic
+                            match['serial'] = serial_from_tree(tree, output['query']['cnr']) or match.get('serial')
+                    if match:
+                        output['found'] = True
+                        output['matches'].append(match)
+                        print(f"[+] Case found ({output['query']}). Context:")
+                        print(match['context'])
+                        if match.get('serial'): print("Serial:", match.get('serial'))
+                        if match.get('court'): print("Court:", match.get('court'))
+                    else:
+                        print(f"[!] Case not found in the displayed cause list content ({output['query']}).")
+                        output['notes'].append("Case not found in the displayed cause list content.")
+                if args.verbose_output:
+                    for output in pending:
+                        output['raw_html'] = page.get('raw_html')
+                        output['raw_text'] = page.get('raw_text')
+                # if pdf was captured, record where it was saved
+                if sres.get('cause_list_pdf'):
+                    for output in pending:
+                        output['cause_list_pdf'] = sres['cause_list_pdf']
 
     # Save output JSON
-    save_json(output, args.out)
+    save_json(outputs[0] if not args.cases_file else {"results": outputs}, args.out)
     print("[i] Done.")
 
 if __name__ == '__main__':